@@ -18,6 +18,8 @@ TESTS::
 
 from __future__ import annotations
 
+from functools import lru_cache
+
 from sage.symbolic.ring import SR
 
 from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing, AsymptoticExpansion
@@ -76,6 +78,7 @@ def _add_monomial_growth_restriction_to_ring(
     return AR.change_parameter(term_monoid_factory=term_monoid_factory)
 
 
+@lru_cache(maxsize=32, typed=True)
 def AsymptoticRingWithDependentVariable(
     growth_group,
     dependent_variable,
@@ -133,6 +136,22 @@ def AsymptoticRingWithDependentVariable(
         sage: O(k*n)
         O(n^(3/2))
 
+    Repeated calls with the same arguments return the same ring::
+
+        sage: dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2)[0] is A
+        True
+
+    Rings over different growth groups do not share the bounds of their
+    term monoids, even if the bounds compare equal::
+
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1)
+        sage: AZ, n, k = dbt.AsymptoticRingWithDependentVariable('n^ZZ', 'k', 0, 1)
+        sage: AZ.term_monoid('O').variable_bounds[2].parent()
+        Asymptotic Ring <n^ZZ> over Symbolic Ring
+        sage: AL, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ * log(n)^QQ', 'k', 0, 1)
+        sage: AL.term_monoid('B').variable_bounds[2].parent()
+        Asymptotic Ring <n^QQ * log(n)^QQ> over Symbolic Ring
+
     Make sure that scaled monomial bounds also work as intended::
 
         sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 0, 1/2,
@@ -18,6 +18,7 @@ TESTS::
 
 from __future__ import annotations
 
+from functools import cache, lru_cache, wraps
 
 from sage.functions.other import ceil
 from sage.rings.asymptotic.asymptotic_ring import AsymptoticRing
@@ -30,13 +31,15 @@ from sage.rings.asymptotic.term_monoid import (
     TermWithCoefficient,
     ExactTerm,
 )
+from sage.rings.integer_ring import ZZ
+from sage.structure.element import parent
 from sage.symbolic.assumptions import assuming
 from sage.symbolic.expression import Expression
 from sage.symbolic.operators import add_vararg
 
 from sage.symbolic.ring import SR
 
-from .utils import evaluate
+from .utils import _contains_var, _evaluate_at_values
 
 
 def _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound):
@@ -54,6 +57,46 @@ def _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound):
         )
 
 
+def _cached_by_bounds(monoid_factory):
+    """Decorator caching the term monoid classes constructed by
+    the given factory function.
+
+    Bounds living in different asymptotic rings might compare equal
+    via coercion, so their parents are part of the cache key, too.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: from dependent_bterms.structures import MonBoundOTermMonoidFactory
+        sage: A.<n> = AsymptoticRing('n^QQ', SR)
+        sage: B.<n> = AsymptoticRing('n^ZZ', SR)
+        sage: k = SR.var('k')
+        sage: OTM = MonBoundOTermMonoidFactory(k, A(1), A(n))
+        sage: OTM is MonBoundOTermMonoidFactory(k, A(1), A(n))
+        True
+        sage: OTM is MonBoundOTermMonoidFactory(k, B(1), B(n))
+        False
+    """
+
+    @cache
+    def cached_factory(bound_parents, dependent_variable, *args, **kwds):
+        return monoid_factory(dependent_variable, *args, **kwds)
+
+    @wraps(monoid_factory)
+    def factory(dependent_variable, lower_bound, upper_bound, *args, **kwds):
+        return cached_factory(
+            (parent(lower_bound), parent(upper_bound)),
+            dependent_variable,
+            lower_bound,
+            upper_bound,
+            *args,
+            **kwds,
+        )
+
+    return factory
+
+
 def _element_key(element):
     """Determine the key for sorting the given element into the poset
     underlying an asymptotic expansion.
@@ -65,31 +108,124 @@ def _element_key(element):
     The second component is the element growth (regardless of any coefficient).
     """
     growth_bound = None
-    if hasattr(element.parent(), "variable_bounds"):
-        bound_var, lower, upper = element.parent().variable_bounds
+    parent = element.parent()
+    if hasattr(parent, "variable_bounds") and isinstance(element, TermWithCoefficient):
+        coef = element.coefficient
+        if isinstance(coef, Expression):
+            growth_range = _coefficient_growth_range(parent, coef)
+            if growth_range is not None:
+                growth_bound = growth_range[1] * element.growth
 
-        if isinstance(element, TermWithCoefficient):
-            coef = element.coefficient
+    if growth_bound is None:
+        growth_bound = element.growth
 
-            if isinstance(coef, Expression) and bound_var in coef.variables():
-                with assuming(bound_var > 0):
-                    coef_simplified = coef.simplify()
+    return (growth_bound, element.growth)
 
-                bounds = []
-                for bound in [lower, upper]:
-                    asy_bound = evaluate(coef_simplified, **{str(bound_var): bound})
-                    if asy_bound.is_zero():
-                        asy_bound = bound.parent().one()
-                    bounds.append(asy_bound.O())
 
-                coef_bound = max(bounds, key=lambda expr: list(expr.summands)[0].growth)
-                [coef_bound_term] = list(coef_bound.summands)
-                growth_bound = coef_bound_term.growth * element.growth
+@lru_cache(maxsize=4096)
+def _coefficient_growth_range(parent, coefficient):
+    """Determine the smallest and largest growth of the given coefficient
+    when the dependent variable of ``parent`` is replaced by its lower
+    and upper bound, respectively.
 
-    if growth_bound is None:
-        growth_bound = element.growth
+    Returns ``None`` if the coefficient does not contain the dependent
+    variable.
 
-    return (growth_bound, element.growth)
+    Internal helper function. The results are cached, as the
+    involved symbolic simplification and substitution are expensive
+    and the same coefficients are queried over and over again when
+    sorting terms into a poset.
+    """
+    bound_var, lower, upper = parent.variable_bounds
+    if not _contains_var(coefficient, bound_var):
+        return None
+
+    with assuming(bound_var > 0):
+        coef_simplified = coefficient.simplify()
+
+    monomial_range = _monomial_growth_range(coef_simplified, bound_var, lower, upper)
+    if monomial_range is not None:
+        return monomial_range
+
+    def bound_growth(asy_bound, bound):
+        if asy_bound.is_zero():
+            asy_bound = bound.parent().one()
+        return next(iter(asy_bound.O().summands)).growth
+
+    lower_value, upper_value = _evaluate_at_values(
+        coef_simplified, bound_var, (lower, upper)
+    )
+    lower_growth = bound_growth(lower_value, lower)
+    upper_growth = bound_growth(upper_value, upper)
+    if lower_growth <= upper_growth:
+        return (lower_growth, upper_growth)
+    return (upper_growth, lower_growth)
+
+
+def _monomial_growth_range(coefficient, dependent_variable, lower, upper):
+    """Determine the smallest and largest growth of a coefficient of the
+    form ``c*k^d``, where ``k`` is the dependent variable, ``d`` is an
+    integer, and ``c`` does not depend on ``k``.
+
+    In this case, the growth can be read off from the (single) terms
+    of the bounds directly, and no symbolic evaluation is required.
+    Returns ``None`` if the coefficient is not of this form, or if
+    one of the bounds does not consist of a single term.
+
+    Internal helper function.
+
+    TESTS::
+
+        sage: import dependent_bterms as dbt
+        sage: from dependent_bterms.structures import _monomial_growth_range
+        sage: A, n, k = dbt.AsymptoticRingWithDependentVariable('n^QQ', 'k', 1, 1/2,
+        ....:     upper_bound_factor=3)
+        sage: _monomial_growth_range(42*k^3, k, A(n), A(3*n^(1/2)))
+        (n^(3/2), n^3)
+        sage: _monomial_growth_range(1/k^2, k, A(n), A(3*n^(1/2)))
+        (n^(-2), n^(-1))
+        sage: _monomial_growth_range(k + 1, k, A(n), A(3*n^(1/2))) is None
+        True
+        sage: var('x')
+        x
+        sage: _monomial_growth_range(k^x, k, A(n), A(3*n^(1/2))) is None
+        True
+        sage: _monomial_growth_range(k^pi, k, A(n), A(3*n^(1/2))) is None
+        True
+
+    Coefficients with non-integer exponents fall back to evaluating
+    the coefficient at the bounds::
+
+        sage: k^pi*n^2 + O(n^3)
+        k^pi*n^2 + O(n^3)
+        sage: k^x*n + k^x
+        k^x*n + k^x
+
+    Monomial coefficients are handled without evaluation::
+
+        sage: O(n/k^2)
+        O(1)
+    """
+    try:
+        degree = coefficient.degree(dependent_variable)
+        if degree not in ZZ:
+            return None
+        lead = coefficient.coefficient(dependent_variable, degree)
+    except RuntimeError:
+        # the degree is undefined for non-integer exponents, like in k^x
+        return None
+    if dependent_variable in lead.variables() or not (
+        (coefficient - lead * dependent_variable**degree).is_trivial_zero()
+    ):
+        return None
+
+    growths = []
+    for bound in (lower, upper):
+        if len(bound.summands) != 1:
+            return None
+        growths.append(next(iter(bound.summands)).growth ** degree)
+
+    return (min(growths), max(growths))
 
 
 class AsymptoticRingWithCustomPosetKey(AsymptoticRing):
@@ -104,9 +240,12 @@ class AsymptoticRingWithCustomPosetKey(AsymptoticRing):
         element = super()._element_constructor_(
             data, simplify=simplify, convert=convert
         )
+        if getattr(element._summands_, "_key_", None) is _element_key:
+            # summands are already sorted with respect to our custom key
+            return element
 
         element._summands_ = MutablePoset(
-            list(element.summands),
+            element.summands.elements(),
             key=_element_key,
             can_merge=can_absorb,
             merge=absorption,
@@ -182,18 +321,22 @@ class MonBoundOTerm(OTerm):
 
     def __init__(self, parent, growth, coefficient):
         self._growth = growth
-        if (
-            isinstance(coefficient, Expression)
-            and parent.dependent_variable in coefficient.variables()
+        if isinstance(coefficient, Expression) and _contains_var(
+            coefficient, parent.dependent_variable
         ):
-            _, lower, upper = parent.variable_bounds
-            bounds = []
-            for value in (lower, upper):
-                eval_arg = {str(parent.dependent_variable): value}
-                bounds.append(evaluate(coefficient, **eval_arg).O())
-
-            [coefficient_bound] = list(sum(bounds).summands)
-            growth *= coefficient_bound.growth
+            dependent_variable, lower, upper = parent.variable_bounds
+            monomial_range = _monomial_growth_range(
+                coefficient, dependent_variable, lower, upper
+            )
+            if monomial_range is not None:
+                growth *= monomial_range[1]
+            else:
+                lower_value, upper_value = _evaluate_at_values(
+                    coefficient, dependent_variable, (lower, upper)
+                )
+                lower_growth = next(iter(lower_value.O().summands)).growth
+                upper_growth = next(iter(upper_value.O().summands)).growth
+                growth *= max(lower_growth, upper_growth)
 
         super().__init__(parent, growth)
 
@@ -202,13 +345,18 @@ class MonBoundOTerm(OTerm):
 
     def can_absorb(self, other):
         if isinstance(other, TermWithCoefficient):
-            return all(
-                self.growth >= growth_bound
-                for growth_bound in other.dependent_growth_range()
-            )
+            coefficient = other.coefficient
+            if isinstance(coefficient, Expression) and _contains_var(
+                coefficient, self.parent().dependent_variable
+            ):
+                return all(
+                    self.growth >= growth_bound
+                    for growth_bound in other.dependent_growth_range()
+                )
         return self.growth >= other.growth
 
 
+@_cached_by_bounds
 def MonBoundOTermMonoidFactory(dependent_variable, lower_bound, upper_bound):
     _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound)
 
@@ -269,9 +417,8 @@ class MonBoundBTerm(BTerm):
                 return SR(ceil(c * 10**prec) / 10**prec)
             return c
 
-        if (
-            isinstance(coef, Expression)
-            and parent.dependent_variable in coef.variables()
+        if isinstance(coef, Expression) and _contains_var(
+            coef, parent.dependent_variable
         ):
             with assuming(parent.dependent_variable > 0):
                 coef_expanded = coef.simplify().expand()
@@ -285,30 +432,15 @@ class MonBoundBTerm(BTerm):
         super().__init__(parent, growth, valid_from, **kwds)
 
     def dependent_growth_range(self):
-        if hasattr(self, "_cached_growth_range"):
-            return self._cached_growth_range
+        if not isinstance(self.coefficient, Expression):
+            return (self.growth, self.growth)
 
-        dependent_variable, lower, upper = self.parent().variable_bounds
-        if not (
-            isinstance(self.coefficient, Expression)
-            and dependent_variable in self.coefficient.variables()
-        ):
+        growth_range = _coefficient_growth_range(self.parent(), self.coefficient)
+        if growth_range is None:
             return (self.growth, self.growth)
 
-        boundary_growths = []
-        with assuming(dependent_variable > 0):
-            coef_simplified = self.coefficient.simplify()
-        for value in (lower, upper):
-            eval_arg = {str(dependent_variable): value}
-            term = evaluate(coef_simplified, **eval_arg)
-            if term.is_zero():
-                term = value.parent().one()
-            term = term.O()
-            [term] = list(term.summands)
-            boundary_growths.append(term.growth * self.growth)
-
-        self._cached_growth_range = (min(boundary_growths), max(boundary_growths))
-        return self._cached_growth_range
+        lower_growth, upper_growth = growth_range
+        return (lower_growth * self.growth, upper_growth * self.growth)
 
     def can_absorb(self, other):
         self_growth_lower, self_growth_upper = self.dependent_growth_range()
@@ -355,7 +487,7 @@ class MonBoundBTerm(BTerm):
 
         other_coef_bound = other_coef_abs(k=1)
         deg_difference = other_coef.degree(k) - self_coef.degree(k)
-        [difference_term] = list((upper**deg_difference).summands)
+        difference_term = next(iter((upper**deg_difference).summands))
 
         other_bound = other.parent()(
             other.growth * difference_term.growth,
@@ -364,6 +496,7 @@ class MonBoundBTerm(BTerm):
         return super()._absorb_(other_bound)
 
 
+@_cached_by_bounds
 def MonBoundBTermMonoidFactory(
     dependent_variable, lower_bound, upper_bound, bterm_round_to
 ):
@@ -393,29 +526,15 @@ def MonBoundBTermMonoidFactory(
 
 class MonBoundExactTerm(ExactTerm):
     def dependent_growth_range(self):
-        if hasattr(self, "_cached_growth_range"):
-            return self._cached_growth_range
-
-        dependent_variable, lower, upper = self.parent().variable_bounds
-        if dependent_variable not in self.coefficient.variables():
+        growth_range = _coefficient_growth_range(self.parent(), self.coefficient)
+        if growth_range is None:
             return (self.growth, self.growth)
 
-        boundary_growths = []
-        with assuming(dependent_variable > 0):
-            coef_simplified = self.coefficient.simplify()
-        for value in (lower, upper):
-            eval_arg = {str(dependent_variable): value}
-            term = evaluate(coef_simplified, **eval_arg)
-            if term.is_zero():
-                term = value.parent().one()
-            term = term.O()
-            [term] = list(term.summands)
-            boundary_growths.append(term.growth * self.growth)
-
-        self._cached_growth_range = (min(boundary_growths), max(boundary_growths))
-        return self._cached_growth_range
+        lower_growth, upper_growth = growth_range
+        return (lower_growth * self.growth, upper_growth * self.growth)
 
 
+@_cached_by_bounds
 def MonBoundExactTermMonoidFactory(dependent_variable, lower_bound, upper_bound):
     _verify_variable_and_bounds(dependent_variable, lower_bound, upper_bound)
 
@@ -16,6 +16,7 @@ TESTS::
 
 from __future__ import annotations
 
+from functools import lru_cache
 
 from sage.arith.srange import srange
 from sage.ext.fast_callable import fast_callable
@@ -35,6 +36,7 @@ from sage.rings.infinity import Infinity as oo
 from sage.symbolic.ring import SR
 from sage.rings.real_mpfi import RIF
 from sage.rings.integer_ring import Z as ZZ
+from sage.rings.rational_field import QQ
 
 import dependent_bterms as dbt
 
@@ -86,7 +88,61 @@ def evaluate(expression: Expression, expand=True, **eval_args):
     expression_vars = expression.variables()
     function_args = [eval_args.get(str(var), var) for var in expression_vars]
 
-    return fast_callable(expression, vars=expression_vars)(*function_args)
+    return _compile(expression, expression_vars)(*function_args)
+
+
+def _evaluate_at_values(
+    expression: Expression, variable: Expression, values, expand=True
+):
+    """Evaluate a symbolic expression once for each of the given
+    values substituted for ``variable``.
+
+    Internal helper function. In contrast to calling :func:`evaluate`
+    repeatedly, the expression is only expanded once.
+
+    EXAMPLES::
+
+        sage: from dependent_bterms.utils import _evaluate_at_values
+        sage: var('a b')
+        (a, b)
+        sage: res = _evaluate_at_values(a^2 + 1, a, (2, 1/2))
+        sage: res, [r.parent() for r in res]
+        ([5, 5/4], [Integer Ring, Rational Field])
+        sage: _evaluate_at_values((a + b)^2, a, (0, b))
+        [b^2, 4*b^2]
+
+        sage: A.<n> = AsymptoticRing('n^QQ', SR)
+        sage: _evaluate_at_values(a/b, a, (n, 1/n))
+        [1/b*n, 1/b*n^(-1)]
+
+    """
+    if expand:
+        expression = expression.expand()
+    name = str(variable)
+    return [evaluate(expression, expand=False, **{name: value}) for value in values]
+
+
+@lru_cache(maxsize=2048)
+def _compile(expression: Expression, variables: tuple):
+    """Compile the given symbolic expression to a fast callable
+    with the specified positional variables.
+
+    Internal helper function. The compiled callables are cached,
+    as the same expressions are evaluated repeatedly when
+    constructing terms with bounded coefficients.
+    """
+    return fast_callable(expression, vars=variables)
+
+
+@lru_cache(maxsize=8192)
+def _contains_var(expression: Expression, variable: Expression) -> bool:
+    """Check whether the given symbolic variable occurs in the
+    given symbolic expression.
+
+    Internal helper function. The results are cached, as determining
+    the variables requires a traversal of the whole expression tree.
+    """
+    return variable in expression.variables()
 
 
 def _distribute_coefficient(
@@ -109,12 +165,14 @@ def _distribute_coefficient(
         )
         return [evaluate(coef_expanded, **{str(k): upper}) * rest]
     if coef_expanded.operator() is add_vararg:
+        create_summand = ring.create_summand
+        growth = summand.growth
         for part_coef in coef_expanded.operands():
             result_summands.append(
-                ring.create_summand(
+                create_summand(
                     term_type,
                     coefficient=part_coef,
-                    growth=summand.growth,
+                    growth=growth,
                     **extra_args,
                 )
             )
@@ -156,30 +214,39 @@ def simplify_expansion(
 
     """
     A = expr.parent()
-    new_expr = A.zero()
-    for summand in expr.summands:
-        if isinstance(summand, OTerm):
-            new_expr += A(summand)
-        elif isinstance(summand, BTerm):
-            k, _, _ = summand.parent().variable_bounds
-            if k in summand.coefficient.variables():
-                distributed_summands = _distribute_coefficient(
-                    summand, A, simplify_bterm_growth=simplify_bterm_growth
-                )
-                for part_summand in distributed_summands:
-                    new_expr += part_summand
-            else:
-                new_expr += A(summand)
 
+    # error terms are processed first such that they
+    # can absorb parts of the exact terms afterwards
+    error_summands = []
+    exact_summands = []
     for summand in expr.summands:
         if summand.is_exact():
-            k, _, _ = summand.parent().variable_bounds
-            if k in summand.coefficient.variables():
-                distributed_summands = _distribute_coefficient(summand, A)
-                for part_summand in distributed_summands:
-                    new_expr += part_summand
-            else:
-                new_expr += A(summand)
+            exact_summands.append(summand)
+        elif isinstance(summand, (OTerm, BTerm)):
+            error_summands.append(summand)
+
+    k = None
+    if exact_summands or any(isinstance(s, BTerm) for s in error_summands):
+        k = A.term_monoid("exact").dependent_variable
+
+    new_expr = A.zero()
+    for summand in error_summands:
+        if isinstance(summand, BTerm) and _contains_var(summand.coefficient, k):
+            distributed_summands = _distribute_coefficient(
+                summand, A, simplify_bterm_growth=simplify_bterm_growth
+            )
+            for part_summand in distributed_summands:
+                new_expr += part_summand
+        else:
+            new_expr += A(summand)
+
+    for summand in exact_summands:
+        if _contains_var(summand.coefficient, k):
+            distributed_summands = _distribute_coefficient(summand, A)
+            for part_summand in distributed_summands:
+                new_expr += part_summand
+        else:
+            new_expr += A(summand)
 
     return new_expr
 
@@ -284,18 +351,21 @@ def set_bterm_valid_from(asy: AsymptoticExpansion, valid_from: dict[str, int] |
         sage: set_bterm_valid_from(t, valid_from=5)
         B(k^(-1), k >= 5, m >= 5) + B(m^(-1), k >= 10, m >= 10)
     """
+    bterms = [term for term in asy.summands if isinstance(term, BTerm)]
+    if not bterms:
+        return asy
+
     default_value = ZZ.one()
     if valid_from in ZZ:
         default_value = valid_from
         valid_from = dict()
     else:
         valid_from = {str(v): bound for (v, bound) in valid_from.items()}
-    for term in asy.summands:
-        if isinstance(term, BTerm):
-            for v, bound in term.valid_from.items():
-                passed_bound = valid_from.get(v, default_value)
-                if bound < passed_bound:
-                    term.valid_from[v] = passed_bound
+    for term in bterms:
+        for v, bound in term.valid_from.items():
+            passed_bound = valid_from.get(v, default_value)
+            if bound < passed_bound:
+                term.valid_from[v] = passed_bound
     return asy
 
 
@@ -353,12 +423,41 @@ def expansion_upper_bound(
         sage: expansion_upper_bound((-2 + k)/n, numeric=True, valid_from=10)
         1/10*sqrt(10) + 1/5
 
+    TESTS:
+
+    Numeric bounds over rational coefficients, also for several
+    variables and plain Python integers::
+
+        sage: AQ.<m> = AsymptoticRing('m^ZZ', QQ)
+        sage: expansion_upper_bound(1/m - AQ.B(1/m^2, valid_from=5), numeric=True)
+        6/25
+        sage: expansion_upper_bound(1/m, numeric=True, valid_from=int(5))
+        1/5
+        sage: AM.<x, y> = AsymptoticRing('x^QQ * y^QQ', QQ)
+        sage: expansion_upper_bound(1/x + 1/y^2 - AM.B(1/(x*y), valid_from=3),
+        ....:     numeric=True, valid_from=2)
+        5/9
+        sage: expansion_upper_bound(1/x + 2*y, numeric=True, valid_from=2)
+        Traceback (most recent call last):
+        ...
+        ValueError: Cannot determine numeric bound, the expansion 2*y + x^(-1) does not seem to be bounded.
+
+    Constant expansions remain asymptotic expansions::
+
+        sage: bound = expansion_upper_bound(AQ(2), numeric=True)
+        sage: bound, bound.parent()
+        (2, Asymptotic Ring <m^ZZ> over Rational Field)
+
     """
     A = asy.parent()
-    bound = A.zero()
+    create_summand = A.create_summand
     valid_from = {
         v: valid_from or A.coefficient_ring.one() for v in asy.variable_names()
     }
+
+    # collect the coefficients of the bound per growth first, such
+    # that the summands only have to be sorted into the poset once
+    coef_by_growth = {}
     for summand in asy.summands:
         if isinstance(summand, TermWithCoefficient):
             coef = summand.coefficient
@@ -371,17 +470,28 @@ def expansion_upper_bound(
                     coef = sum(abs(c) * k**p for (c, p) in coef.coefficients(k))
             else:
                 coef = abs(coef)
-            bound += A.create_summand(
-                "exact",
-                coefficient=coef,
-                data=summand.growth,
-            )
+            growth = summand.growth
+            if growth in coef_by_growth:
+                coef_by_growth[growth] += coef
+            else:
+                coef_by_growth[growth] = coef
             if isinstance(summand, BTerm):
                 for v, bd in summand.valid_from.items():
                     valid_from[v] = max(valid_from[v], bd)
         else:
             raise ValueError(f"No same-order bound can be constructed for {summand}")
 
+    # expansions without any variables are returned as expansions below
+    if numeric and valid_from and A.coefficient_ring in (ZZ, QQ):
+        numeric_bound = _exact_numeric_bound(coef_by_growth, valid_from, A)
+        if numeric_bound is not None:
+            return numeric_bound
+
+    bound = A.sum(
+        create_summand("exact", coefficient=coef, data=growth)
+        for growth, coef in coef_by_growth.items()
+    )
+
     if numeric:
         # check that expansion is bounded, in O(1)
         OT_one = A.term_monoid("O")(A.growth_group.one())
@@ -403,6 +513,49 @@ def expansion_upper_bound(
     return bound
 
 
+def _exact_numeric_bound(
+    coef_by_growth: dict,
+    valid_from: dict,
+    ring: AsymptoticRing,
+):
+    """Evaluate the bound described by ``coef_by_growth`` (a dictionary
+    mapping growths to coefficients) at the point specified by
+    ``valid_from``, without constructing an asymptotic expansion.
+
+    Only suitable for coefficient rings with exact numeric
+    coefficients, i.e., where no dependent variable is involved.
+    Returns ``None`` if some growth is not in O(1).
+
+    Internal helper function for :func:`expansion_upper_bound`.
+
+    TESTS::
+
+        sage: from dependent_bterms.utils import _exact_numeric_bound
+        sage: A.<n> = AsymptoticRing('n^QQ', QQ)
+        sage: g = next(iter(n.summands)).growth
+        sage: _exact_numeric_bound({g^-1: 2, g^-2: 3}, {'n': 5}, A)
+        13/25
+        sage: _exact_numeric_bound({g: 0, g^-1: 2}, {'n': 5}, A)
+        2/5
+        sage: _exact_numeric_bound({g: 1, g^-1: 2}, {'n': 5}, A) is None
+        True
+    """
+    one = ring.growth_group.one()
+    if not all(growth <= one for growth, coef in coef_by_growth.items() if coef):
+        return None
+
+    coefficient_ring = ring.coefficient_ring
+    zero = coefficient_ring.zero()
+    # convert the values such that plain Python integers do not lead
+    # to floating point results
+    rules = {v: coefficient_ring(bound) for v, bound in valid_from.items()}
+    rules.update(_zero_=zero, _one_=coefficient_ring.one())
+    return sum(
+        (coef * growth._substitute_(rules) for growth, coef in coef_by_growth.items()),
+        zero,
+    )
+
+
 def taylor_with_explicit_error(
     f,
     term: AsymptoticExpansion,
@@ -505,13 +658,13 @@ def taylor_with_explicit_error(
 
     taylor_bound = bound_const * term_power
     if valid_from is None:
-        valid_from = {str(v): ZZ.one() for v in AR.gens()}
+        valid_from = dict.fromkeys((str(v) for v in AR.gens()), ZZ.one())
         for summand in taylor_bound.error_part().summands:
             if isinstance(summand, BTerm):
-                valid_from = {
-                    v: max(bd, summand.valid_from.get(v, ZZ.one()))
-                    for v, bd in valid_from.items()
-                }
+                for v, bd in valid_from.items():
+                    summand_bd = summand.valid_from.get(v, bd)
+                    if summand_bd > bd:
+                        valid_from[v] = summand_bd
 
     taylor_bound = AR.B(taylor_bound, valid_from=valid_from)
     return taylor_expansion + taylor_bound